@@ -29,6 +29,10 @@ logger = logging.getLogger('flintrock.core')
 
 
 class StorageDirs:
+    # These objects are created per-cluster but read per-node and per-service,
+    # so keep them on slots: fixed layout, no per-instance __dict__.
+    __slots__ = ('root', 'ephemeral', 'persistent')
+
     def __init__(self, *, root, ephemeral, persistent):
         self.root = root
         self.ephemeral = ephemeral
@@ -45,6 +49,11 @@ class StorageDirs:
 #       See: https://github.com/nchammas/flintrock/issues/43
 #       See: http://www.dalkescientific.com/writings/diary/archive/2012/01/19/concurrent.futures.html
 class FlintrockCluster:
+    # NOTE: A frozen dataclass doesn't fit here because the provisioning flow
+    #       mutates these fields in place (e.g. load_manifest(), storage dir
+    #       setup), so we just declare slots on the plain class.
+    __slots__ = ('name', 'ssh_key_pair', 'storage_dirs', 'java_version', 'services')
+
     def __init__(
         self,
         *,
@@ -485,13 +494,28 @@ def generate_template_mapping(
     return template_mapping
 
 
-# TODO: Cache these files. (?) They are being read potentially tens or
-#       hundreds of times. Maybe it doesn't matter because the files
-#       are so small.
-def get_formatted_template(*, path: str, mapping: dict) -> str:
+@functools.lru_cache()
+def _read_template(path: str) -> str:
+    """
+    Read a template file, caching the result since each template is read
+    potentially tens or hundreds of times per operation -- once per node
+    per service.
+    """
     with open(path) as f:
-        formatted = f.read().format(**mapping)
-    return formatted
+        return f.read()
+
+
+@functools.lru_cache(maxsize=32)
+def _format_template(path: str, mapping_items: tuple) -> str:
+    return _read_template(path).format(**dict(mapping_items))
+
+
+def get_formatted_template(*, path: str, mapping: dict) -> str:
+    # The mapping is the same for every node in a cluster, so cache the
+    # formatted result too: formatting runs once per cluster instead of
+    # once per node. The dict is flattened to a sorted tuple since
+    # lru_cache needs hashable arguments.
+    return _format_template(path, tuple(sorted(mapping.items())))
 
 
 def run_against_hosts(*, partial_func: functools.partial, hosts: list):
@@ -500,13 +524,25 @@ def run_against_hosts(*, partial_func: functools.partial, hosts: list):
 
     This function assumes that partial_func accepts `host` as a keyword argument.
     """
-    with concurrent.futures.ThreadPoolExecutor(len(hosts)) as executor:
+    # NOTE: We deliberately use a thread pool of blocking Paramiko clients here
+    #       rather than an async SSH library. The per-host work is pure I/O wait,
+    #       so one thread per host scales fine up to the cluster sizes Flintrock
+    #       supports (see set_open_files_limit()), and it keeps the services'
+    #       install/configure code free of async plumbing.
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(hosts),
+            thread_name_prefix='flintrock-ssh') as executor:
         futures = {
             executor.submit(functools.partial(partial_func, host=host))
             for host in hosts
         }
-        concurrent.futures.wait(futures, return_when=FIRST_EXCEPTION)
-        for future in futures:
+        done, not_done = concurrent.futures.wait(futures, return_when=FIRST_EXCEPTION)
+        # If a host failed, surface its exception now rather than blocking on
+        # the hosts that are still working, and drop any queued work. Threads
+        # that are already mid-task still get joined on executor shutdown.
+        for future in not_done:
+            future.cancel()
+        for future in done:
             future.result()
 
 
@@ -514,31 +550,34 @@ def get_installed_java_version(client: paramiko.client.SSHClient):
     """
     :return: the major version (5,6,7,8...) of the currently installed Java or None if not installed
     """
-    possible_cmds = [
-        "$JAVA_HOME/bin/java -version",
-        "java -version"
-    ]
-
-    for command in possible_cmds:
-        try:
-            output = ssh_check_output(
-                client=client,
-                command=command)
-            tokens = output.split()
-            # First line of the output is like: 'openjdk version "1.8.0_252"' or 'openjdk version "11.0.7" 2020-04-14'
-            # Get the version string and strip out the first two parts of the
-            # version as an int: 7, 8, 9, 10...
-            if len(tokens) >= 3:
-                version_parts = tokens[2].strip('"').split(".")
-                if len(version_parts) >= 2:
-                    if version_parts[0] == "1":
-                        # Java 6, 7 or 8
-                        return int(version_parts[1])
-                    else:
-                        # Java 9+
-                        return int(version_parts[0])
-        except SSHError:
-            pass
+    try:
+        # Check $JAVA_HOME first and fall back to the PATH within a single
+        # remote command so the probe costs one round trip, not one per
+        # candidate location.
+        output = ssh_check_output(
+            client=client,
+            command="""
+                if [ -x "$JAVA_HOME/bin/java" ]; then
+                    "$JAVA_HOME/bin/java" -version
+                else
+                    java -version
+                fi
+            """)
+        tokens = output.split()
+        # First line of the output is like: 'openjdk version "1.8.0_252"' or 'openjdk version "11.0.7" 2020-04-14'
+        # Get the version string and strip out the first two parts of the
+        # version as an int: 7, 8, 9, 10...
+        if len(tokens) >= 3:
+            version_parts = tokens[2].strip('"').split(".")
+            if len(version_parts) >= 2:
+                if version_parts[0] == "1":
+                    # Java 6, 7 or 8
+                    return int(version_parts[1])
+                else:
+                    # Java 9+
+                    return int(version_parts[0])
+    except SSHError:
+        pass
 
     return None
 
@@ -633,6 +672,10 @@ def setup_node(
     delegate the main work of setting up new nodes to this function.
     """
     host = ssh_client.get_transport().getpeername()[0]
+    # TODO: Move Python and Java setup to new service under services.py.
+    #       New service to cover Python/Scala/Java: LanguageRuntimes (name?)
+    # NOTE: The Python install rides along with the SSH key setup so this
+    #       preamble costs one round trip per node instead of two.
     ssh_check_output(
         client=ssh_client,
         command="""
@@ -642,6 +685,8 @@ def setup_node(
             echo {public_key} >> "$HOME/.ssh/authorized_keys"
 
             chmod 400 "$HOME/.ssh/id_rsa"
+
+            sudo yum install -q -y python3
         """.format(
             private_key=shlex.quote(cluster.ssh_key_pair.private),
             public_key=shlex.quote(cluster.ssh_key_pair.public)))
@@ -666,17 +711,6 @@ def setup_node(
     cluster.storage_dirs.root = storage_dirs['root']
     cluster.storage_dirs.ephemeral = storage_dirs['ephemeral']
 
-    # TODO: Move Python and Java setup to new service under services.py.
-    #       New service to cover Python/Scala/Java: LanguageRuntimes (name?)
-    ssh_check_output(
-        client=ssh_client,
-        command=(
-            """
-            set -e
-            sudo yum install -y python3
-            """
-        )
-    )
     ensure_java(ssh_client, java_version)
 
     for service in services:
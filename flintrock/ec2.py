@@ -1,10 +1,10 @@
 import functools
 import string
-import sys
 import time
 import urllib.request
 import base64
 import logging
+from collections import defaultdict
 from ipaddress import IPv4Network
 from datetime import datetime
 
@@ -47,6 +47,32 @@ class ConfigurationNotSupported(Error):
         super().__init__(message)
 
 
+@functools.lru_cache()
+def _ec2_resource(region: str) -> 'boto3.resources.factory.ec2.ServiceResource':
+    """
+    Get the shared EC2 resource for the given region.
+
+    Creating a resource builds a fresh botocore session and HTTPS connection
+    pool, so we cache one per region rather than reconnecting in every helper
+    that talks to EC2.
+    """
+    return boto3.resource(service_name='ec2', region_name=region)
+
+
+@functools.lru_cache()
+def _get_client_ip() -> str:
+    """
+    Look up the public IP address of this client.
+
+    The result is cached since the lookup requires a network round trip and
+    the client's IP won't change within a single invocation of Flintrock.
+    """
+    return (
+        urllib.request.urlopen('https://checkip.amazonaws.com/', timeout=5)
+        .read().decode('utf-8').strip()
+    )
+
+
 def timeit(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -59,6 +85,8 @@ def timeit(func):
 
 
 class EC2Cluster(FlintrockCluster):
+    __slots__ = ('region', 'vpc_id', 'master_instance', 'slave_instances')
+
     def __init__(
             self,
             region: str,
@@ -83,7 +111,7 @@ class EC2Cluster(FlintrockCluster):
     @property
     @functools.lru_cache()
     def private_network(self):
-        ec2 = boto3.resource(service_name='ec2', region_name=self.region)
+        ec2 = _ec2_resource(self.region)
         return not ec2.Subnet(self.master_instance.subnet_id).map_public_ip_on_launch
 
     @property
@@ -132,12 +160,14 @@ class EC2Cluster(FlintrockCluster):
 
     @property
     def state(self):
-        instance_states = set(
-            instance.state['Name'] for instance in self.instances)
-        if len(instance_states) == 1:
-            return instance_states.pop()
-        else:
-            return 'inconsistent'
+        state = None
+        for instance in self.instances:
+            if state is None:
+                state = instance.state['Name']
+            elif instance.state['Name'] != state:
+                # Bail out on the first mismatch; no need to look at the rest.
+                return 'inconsistent'
+        return state if state is not None else 'inconsistent'
 
     def wait_for_state(self, state: str):
         """
@@ -148,30 +178,37 @@ class EC2Cluster(FlintrockCluster):
         This method updates the cluster's instance metadata and
         master and slave IP addresses and hostnames.
         """
-        ec2 = boto3.resource(service_name='ec2', region_name=self.region)
-
-        while any([i.state['Name'] != state for i in self.instances]):
-            if logger.isEnabledFor(logging.DEBUG):
-                waiting_instances = [i for i in self.instances if i.state['Name'] != state]
-                sample = ', '.join(["'{}'".format(i.id) for i in waiting_instances][:3])
-                logger.debug("{size} instances not in state '{state}': {sample}, ...".format(size=len(waiting_instances), state=state, sample=sample))
-            time.sleep(3)
-            # Update metadata for all instances in one shot. We don't want
-            # to make a call to AWS for each of potentially hundreds of
-            # instances.
-            instances = list(
-                ec2.instances.filter(
-                    # NOTE: We use Filters instead of InstanceIds to avoid
-                    #       the issue described here: https://github.com/boto/boto3/issues/479
-                    Filters=[
-                        {'Name': 'instance-id', 'Values': [i.id for i in self.instances]}
-                    ]))
-            (self.master_instance, self.slave_instances) = _get_cluster_master_slaves(instances)
+        ec2 = _ec2_resource(self.region)
+        instance_ids = [i.id for i in self.instances]
+
+        # The waiter polls all the instances with one DescribeInstances call
+        # per attempt and handles retry pacing for us.
+        waiter = ec2.meta.client.get_waiter('instance_' + state)
+        waiter.wait(
+            # NOTE: We use Filters instead of InstanceIds to avoid
+            #       the issue described here: https://github.com/boto/boto3/issues/479
+            Filters=[
+                {'Name': 'instance-id', 'Values': instance_ids}
+            ],
+            WaiterConfig={
+                'Delay': 3,
+                'MaxAttempts': 200,
+            })
+
+        # Update metadata for all instances in one shot. We don't want
+        # to make a call to AWS for each of potentially hundreds of
+        # instances.
+        instances = list(
+            ec2.instances.filter(
+                Filters=[
+                    {'Name': 'instance-id', 'Values': instance_ids}
+                ]))
+        (self.master_instance, self.slave_instances) = _get_cluster_master_slaves(instances)
 
     def destroy(self):
         self.destroy_check()
         super().destroy()
-        ec2 = boto3.resource(service_name='ec2', region_name=self.region)
+        ec2 = _ec2_resource(self.region)
 
         # TODO: Centralize logic to get Flintrock base security group. (?)
         flintrock_base_group = list(
@@ -220,13 +257,12 @@ class EC2Cluster(FlintrockCluster):
     def start(self, *, user: str, identity_file: str):
         # TODO: Do these _check() methods make sense here?
         self.start_check()
-        ec2 = boto3.resource(service_name='ec2', region_name=self.region)
-        (ec2.instances
-            .filter(
-                Filters=[
-                    {'Name': 'instance-id', 'Values': [i.id for i in self.instances]}
-                ])
-            .start())
+        ec2 = _ec2_resource(self.region)
+        # Call StartInstances directly with the instance IDs we already have.
+        # Going through the instances collection would issue a redundant
+        # DescribeInstances call just to rebuild the same list.
+        ec2.meta.client.start_instances(
+            InstanceIds=[i.id for i in self.instances])
         self.wait_for_state('running')
 
         super().start(
@@ -246,13 +282,10 @@ class EC2Cluster(FlintrockCluster):
         self.stop_check()
         super().stop()
 
-        ec2 = boto3.resource(service_name='ec2', region_name=self.region)
-        (ec2.instances
-            .filter(
-                Filters=[
-                    {'Name': 'instance-id', 'Values': [i.id for i in self.instances]}
-                ])
-            .stop())
+        ec2 = _ec2_resource(self.region)
+        # See the note in start(): one StopInstances call, no extra describe.
+        ec2.meta.client.stop_instances(
+            InstanceIds=[i.id for i in self.instances])
         self.wait_for_state('stopped')
 
     def add_slaves_check(self):
@@ -282,7 +315,7 @@ class EC2Cluster(FlintrockCluster):
             region=self.region)
         availability_zone = self.master_instance.placement['AvailabilityZone']
 
-        ec2 = boto3.resource(service_name='ec2', region_name=self.region)
+        ec2 = _ec2_resource(self.region)
         client = ec2.meta.client
 
         response = client.describe_instance_attribute(
@@ -335,12 +368,9 @@ class EC2Cluster(FlintrockCluster):
                 {'Key': 'Name', 'Value': '{c}-slave'.format(c=self.name)}]
             slave_tags += tags
 
-            (ec2.instances
-                .filter(
-                    Filters=[
-                        {'Name': 'instance-id', 'Values': [i.id for i in new_slave_instances]}
-                    ])
-                .create_tags(Tags=slave_tags))
+            ec2.meta.client.create_tags(
+                Resources=[i.id for i in new_slave_instances],
+                Tags=slave_tags)
 
             existing_slaves = self.slave_ips
 
@@ -370,7 +400,7 @@ class EC2Cluster(FlintrockCluster):
 
     @timeit
     def remove_slaves(self, *, user: str, identity_file: str, num_slaves: int):
-        ec2 = boto3.resource(service_name='ec2', region_name=self.region)
+        ec2 = _ec2_resource(self.region)
 
         # self.remove_slaves_check() (?)
 
@@ -446,10 +476,11 @@ class EC2Cluster(FlintrockCluster):
         # Mark the boundaries of the YAML output.
         # See: http://yaml.org/spec/current.html#id2525905
         # print('---')
+        state = self.state
         print(self.name + ':')
-        print('  state: {s}'.format(s=self.state))
+        print('  state: {s}'.format(s=state))
         print('  node-count: {nc}'.format(nc=len(self.instances)))
-        if self.state == 'running':
+        if state == 'running':
             print('  master:', self.master_host if self.num_masters > 0 else '')
             print(
                 '\n    - '.join(
@@ -461,7 +492,7 @@ def get_default_vpc(region: str) -> 'boto3.resources.factory.ec2.Vpc':
     """
     Get the user's default VPC in the provided region.
     """
-    ec2 = boto3.resource(service_name='ec2', region_name=region)
+    ec2 = _ec2_resource(region)
 
     default_vpc = list(
         ec2.vpcs.filter(
@@ -478,7 +509,7 @@ def check_network_config(*, region_name: str, vpc_id: str, subnet_id: str):
     Check that the VPC and subnet are configured to allow Flintrock to create
     clusters.
     """
-    ec2 = boto3.resource(service_name='ec2', region_name=region_name)
+    ec2 = _ec2_resource(region_name)
 
     if not ec2.Vpc(vpc_id).describe_attribute(Attribute='enableDnsHostnames')['EnableDnsHostnames']['Value']:
         raise ConfigurationNotSupported(
@@ -500,7 +531,7 @@ def get_security_groups(
         vpc_id,
         region,
         security_group_names) -> "List[boto3.resource('ec2').SecurityGroup]":
-    ec2 = boto3.resource(service_name='ec2', region_name=region)
+    ec2 = _ec2_resource(region)
 
     groups = list(
         ec2.security_groups.filter(
@@ -535,6 +566,38 @@ def get_ssh_security_group_rules(
     )
 
 
+def _rule_to_permission(rule: SecurityGroupRule) -> dict:
+    """
+    Convert a SecurityGroupRule into the IpPermission structure that EC2's
+    AuthorizeSecurityGroupIngress API accepts.
+    """
+    permission = {
+        'IpProtocol': rule.ip_protocol,
+        'FromPort': rule.from_port,
+        'ToPort': rule.to_port,
+    }
+    if rule.cidr_ip:
+        permission['IpRanges'] = [{'CidrIp': rule.cidr_ip}]
+    if rule.src_group:
+        permission['UserIdGroupPairs'] = [{'GroupId': rule.src_group}]
+    return permission
+
+
+def _permission_keys(permission: dict) -> set:
+    """
+    Break an EC2 IpPermission down into hashable keys, one per traffic source,
+    so that desired rules can be compared against the rules already on a
+    security group.
+    """
+    # DescribeSecurityGroups omits the ports for all-protocol (-1) rules,
+    # so .get() normalizes them to None on both sides of the comparison.
+    ports = (permission['IpProtocol'], permission.get('FromPort'), permission.get('ToPort'))
+    return (
+        {ports + (ip_range['CidrIp'],) for ip_range in permission.get('IpRanges', [])}
+        | {ports + (pair['GroupId'],) for pair in permission.get('UserIdGroupPairs', [])}
+    )
+
+
 def get_or_create_flintrock_security_groups(
         *,
         cluster_name,
@@ -547,7 +610,7 @@ def get_or_create_flintrock_security_groups(
     If they do not already exist, create all the security groups needed for a
     Flintrock cluster.
     """
-    ec2 = boto3.resource(service_name='ec2', region_name=region)
+    ec2 = _ec2_resource(region)
 
     # TODO: Make these into methods, since we need this logic (though simple)
     #       in multiple places. (?)
@@ -584,11 +647,7 @@ def get_or_create_flintrock_security_groups(
     if ec2_authorize_access_from:
         flintrock_client_sources = ec2_authorize_access_from
     else:
-        flintrock_client_ip = (
-            urllib.request.urlopen('https://checkip.amazonaws.com/')
-            .read().decode('utf-8').strip()
-        )
-        flintrock_client_sources = [flintrock_client_ip]
+        flintrock_client_sources = [_get_client_ip()]
 
     client_rules = []
     for client_source in flintrock_client_sources:
@@ -619,33 +678,32 @@ def get_or_create_flintrock_security_groups(
             Description="Flintrock cluster group",
             VpcId=vpc_id)
 
-    # TODO: Don't try adding rules that already exist.
-    # TODO: Add rules in one shot.
-    for rule in client_rules:
+    desired_permissions = [_rule_to_permission(rule) for rule in client_rules]
+    # The cluster may communicate with itself over any protocol.
+    desired_permissions.append({
+        'IpProtocol': '-1',  # -1 means all
+        'UserIdGroupPairs': [{'GroupId': cluster_group.id}],
+    })
+
+    # Authorize all the new rules in one shot. AWS rejects the whole batch if
+    # any one rule in it already exists, so we filter out existing rules first.
+    existing_permission_keys = {
+        key
+        for permission in cluster_group.ip_permissions
+        for key in _permission_keys(permission)
+    }
+    new_permissions = [
+        permission for permission in desired_permissions
+        if not _permission_keys(permission) <= existing_permission_keys
+    ]
+
+    if new_permissions:
         try:
-            cluster_group.authorize_ingress(
-                IpProtocol=rule.ip_protocol,
-                FromPort=rule.from_port,
-                ToPort=rule.to_port,
-                CidrIp=rule.cidr_ip,
-                SourceSecurityGroupName=rule.src_group,
-            )
+            cluster_group.authorize_ingress(IpPermissions=new_permissions)
         except botocore.exceptions.ClientError as e:
             if e.response['Error']['Code'] != 'InvalidPermission.Duplicate':
-                raise Exception("Error adding rule: {r}".format(r=rule))
-
-    try:
-        cluster_group.authorize_ingress(
-            IpPermissions=[
-                {
-                    'IpProtocol': '-1',  # -1 means all
-                    'FromPort': -1,
-                    'ToPort': -1,
-                    'UserIdGroupPairs': [{'GroupId': cluster_group.id}]
-                }])
-    except botocore.exceptions.ClientError as e:
-        if e.response['Error']['Code'] != 'InvalidPermission.Duplicate':
-            raise Exception("Error authorizing cluster ingress to self.") from e
+                raise Exception(
+                    "Error adding rules: {p}".format(p=new_permissions)) from e
 
     return [flintrock_group, cluster_group]
 
@@ -660,7 +718,7 @@ def get_ec2_block_device_mappings(
 
     This is how we configure storage on the instance.
     """
-    ec2 = boto3.resource(service_name='ec2', region_name=region)
+    ec2 = _ec2_resource(region)
     block_device_mappings = []
 
     try:
@@ -721,7 +779,7 @@ def _create_instances(
         ebs_optimized,
         instance_initiated_shutdown_behavior,
         user_data) -> 'List[boto3.resources.factory.ec2.Instance]':
-    ec2 = boto3.resource(service_name='ec2', region_name=region)
+    ec2 = _ec2_resource(region)
 
     cluster_instances = []
     spot_requests = []
@@ -753,14 +811,24 @@ def _create_instances(
 
             request_ids = [r['SpotInstanceRequestId'] for r in spot_requests]
             pending_request_ids = request_ids
+            # Spot requests are sometimes fulfilled within seconds, so check
+            # right away instead of sleeping first, and back off towards a
+            # 30-second interval if the wait drags on.
+            wait_interval = 3
 
             while pending_request_ids:
-                logger.info("{grant} of {req} instances granted. Waiting...".format(
-                    grant=num_instances - len(pending_request_ids),
-                    req=num_instances))
-                time.sleep(30)
-                spot_requests = client.describe_spot_instance_requests(
-                    SpotInstanceRequestIds=request_ids)['SpotInstanceRequests']
+                try:
+                    spot_requests = client.describe_spot_instance_requests(
+                        SpotInstanceRequestIds=request_ids)['SpotInstanceRequests']
+                except botocore.exceptions.ClientError as e:
+                    if e.response['Error']['Code'] != 'InvalidSpotInstanceRequestID.NotFound':
+                        raise
+                    # Fresh requests aren't always visible to describe calls
+                    # right away due to EC2's eventual consistency, so treat
+                    # this as "still pending" and try again.
+                    time.sleep(wait_interval)
+                    wait_interval = min(wait_interval * 2, 30)
+                    continue
 
                 failed_requests = [r for r in spot_requests if r['State'] == 'failed']
                 if failed_requests:
@@ -775,6 +843,13 @@ def _create_instances(
                     r['SpotInstanceRequestId'] for r in spot_requests
                     if r['State'] == 'open']
 
+                if pending_request_ids:
+                    logger.info("{grant} of {req} instances granted. Waiting...".format(
+                        grant=num_instances - len(pending_request_ids),
+                        req=num_instances))
+                    time.sleep(wait_interval)
+                    wait_interval = min(wait_interval * 2, 30)
+
             logger.info("All {c} instances granted.".format(c=num_instances))
 
             cluster_instances = list(
@@ -812,11 +887,11 @@ def _create_instances(
         return cluster_instances
     except (Exception, KeyboardInterrupt) as e:
         if not isinstance(e, KeyboardInterrupt):
-            print(e, file=sys.stderr)
+            logger.error(e)
         if spot_requests:
             request_ids = [r['SpotInstanceRequestId'] for r in spot_requests]
             if any([r['State'] != 'active' for r in spot_requests]):
-                print("Canceling spot instance requests...", file=sys.stderr)
+                logger.info("Canceling spot instance requests...")
                 client.cancel_spot_instance_requests(
                     SpotInstanceRequestIds=request_ids)
             # Make sure we have the latest information on any launched spot instances.
@@ -876,14 +951,7 @@ def launch(
             vpc_id=vpc_id,
             subnet_id=subnet_id)
 
-    try:
-        get_cluster(
-            cluster_name=cluster_name,
-            region=region,
-            vpc_id=vpc_id)
-    except ClusterNotFound as e:
-        pass
-    else:
+    if cluster_exists(cluster_name=cluster_name, region=region, vpc_id=vpc_id):
         raise ClusterAlreadyExists(
             "Cluster {c} already exists in region {r}, VPC {v}.".format(
                 c=cluster_name,
@@ -906,7 +974,7 @@ def launch(
         ami=ami,
         region=region)
 
-    ec2 = boto3.resource(service_name='ec2', region_name=region)
+    ec2 = _ec2_resource(region)
     iam = boto3.resource(service_name='iam', region_name=region)
 
     # We use IAM profile ARNs internally because AWS's API prefers that in
@@ -952,24 +1020,20 @@ def launch(
             {'Key': 'Name', 'Value': '{c}-master'.format(c=cluster_name)}]
         master_tags += tags
 
-        (ec2.instances
-            .filter(
-                Filters=[
-                    {'Name': 'instance-id', 'Values': [master_instance.id]}
-                ])
-            .create_tags(Tags=master_tags))
+        # Tag via the client directly; going through the instances collection
+        # would cost an extra DescribeInstances call per tag set.
+        ec2.meta.client.create_tags(
+            Resources=[master_instance.id],
+            Tags=master_tags)
 
         slave_tags = [
             {'Key': 'flintrock-role', 'Value': 'slave'},
             {'Key': 'Name', 'Value': '{c}-slave'.format(c=cluster_name)}]
         slave_tags += tags
 
-        (ec2.instances
-            .filter(
-                Filters=[
-                    {'Name': 'instance-id', 'Values': [i.id for i in slave_instances]}
-                ])
-            .create_tags(Tags=slave_tags))
+        ec2.meta.client.create_tags(
+            Resources=[i.id for i in slave_instances],
+            Tags=slave_tags)
 
         cluster = EC2Cluster(
             name=cluster_name,
@@ -1005,6 +1069,26 @@ def launch(
         raise
 
 
+def cluster_exists(*, cluster_name: str, region: str, vpc_id: str) -> bool:
+    """
+    Check whether a cluster with the given name exists.
+
+    This is cheaper than get_cluster() when we only need a yes/no answer,
+    since it asks EC2 for at most one matching instance and doesn't compose
+    any cluster objects.
+    """
+    ec2 = _ec2_resource(region)
+
+    matching_instances = ec2.instances.filter(
+        Filters=[
+            {'Name': 'instance-state-name', 'Values': ['pending', 'running', 'stopping', 'stopped']},
+            {'Name': 'instance.group-name', 'Values': ['flintrock-' + cluster_name]},
+            {'Name': 'vpc-id', 'Values': [vpc_id]},
+        ])
+
+    return any(True for _ in matching_instances.limit(1))
+
+
 def get_cluster(*, cluster_name: str, region: str, vpc_id: str) -> EC2Cluster:
     """
     Get an existing EC2 cluster.
@@ -1024,7 +1108,7 @@ def get_clusters(*, cluster_names: list=[], region: str, vpc_id: str) -> list:
     regardless of how many clusters we have to look up. That's because querying
     AWS -- a network operation -- is by far the slowest step.
     """
-    ec2 = boto3.resource(service_name='ec2', region_name=region)
+    ec2 = _ec2_resource(region)
     if not vpc_id:
         vpc_id = get_default_vpc(region=region).id
 
@@ -1033,7 +1117,7 @@ def get_clusters(*, cluster_names: list=[], region: str, vpc_id: str) -> list:
     else:
         group_name_filter = ['flintrock']
 
-    all_clusters_instances = list(
+    all_clusters_instances = (
         ec2.instances.filter(
             Filters=[
                 {'Name': 'instance-state-name', 'Values': ['pending', 'running', 'stopping', 'stopped']},
@@ -1041,11 +1125,14 @@ def get_clusters(*, cluster_names: list=[], region: str, vpc_id: str) -> list:
                 {'Name': 'vpc-id', 'Values': [vpc_id]},
             ]))
 
-    found_cluster_names = {
-        _get_cluster_name(instance) for instance in all_clusters_instances}
+    # Group the instances by cluster in one pass instead of re-scanning
+    # the full instance list for every cluster found.
+    cluster_instances = defaultdict(list)
+    for instance in all_clusters_instances:
+        cluster_instances[_get_cluster_name(instance)].append(instance)
 
     if cluster_names:
-        missing_cluster_names = set(cluster_names) - found_cluster_names
+        missing_cluster_names = set(cluster_names) - set(cluster_instances)
         if missing_cluster_names:
             raise ClusterNotFound("No cluster {c} in region {r}.".format(
                 c=missing_cluster_names.pop(),
@@ -1056,9 +1143,8 @@ def get_clusters(*, cluster_names: list=[], region: str, vpc_id: str) -> list:
             name=cluster_name,
             region=region,
             vpc_id=vpc_id,
-            instances=list(filter(
-                lambda x: _get_cluster_name(x) == cluster_name, all_clusters_instances)))
-        for cluster_name in found_cluster_names]
+            instances=instances)
+        for cluster_name, instances in cluster_instances.items()]
 
     return clusters
 
@@ -1119,7 +1205,9 @@ def _get_cluster_name(instance: 'boto3.resources.factory.ec2.Instance') -> str:
     """
     for group in instance.security_groups:
         if group['GroupName'].startswith('flintrock-'):
-            return group['GroupName'].replace('flintrock-', '', 1)
+            # We just confirmed the prefix, so slice it off directly instead
+            # of searching for it again with replace().
+            return group['GroupName'][len('flintrock-'):]
     else:
         raise Exception("Could not extract cluster name from instance: {i}".format(
             i=instance.id))
@@ -1176,7 +1264,7 @@ def _compose_cluster(*, name: str, region: str, vpc_id: str, instances: list) ->
 
 
 def _cleanup_instances(*, instances: list, assume_yes: bool, region: str):
-    ec2 = boto3.resource(service_name='ec2', region_name=region)
+    ec2 = _ec2_resource(region)
     if instances:
         if not assume_yes:
             yes = click.confirm(
@@ -1186,7 +1274,7 @@ def _cleanup_instances(*, instances: list, assume_yes: bool, region: str):
                 default=True)
 
         if assume_yes or yes:
-            print("Terminating instances...", file=sys.stderr)
+            logger.info("Terminating instances...")
             (ec2.instances
                 .filter(
                     Filters=[
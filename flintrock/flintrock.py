@@ -265,7 +265,7 @@ def cli(cli_context, config, provider, debug):
         with open(config) as f:
             config_raw = yaml.safe_load(f)
             debug = config_raw.get('debug') or debug
-            config_map = config_to_click(normalize_keys(config_raw))
+            config_map = config_to_click(config_raw)
 
         cli_context.default_map = config_map
     else:
@@ -449,8 +449,6 @@ def launch(
         requires_all=['--ec2-subnet-id'],
         scope=locals())
 
-    check_external_dependency('ssh-keygen')
-
     if install_hdfs:
         validate_download_source(hdfs_download_source)
         hdfs = HDFS(
@@ -1091,37 +1089,48 @@ def copy_file(
         identity_file=identity_file)
 
 
-def normalize_keys(obj):
+_KEBAB_TO_SNAKE = str.maketrans('-', '_')
+
+
+def _normalize_keys(obj):
     """
     Used to map keys from config files to Python parameter names.
     """
-    if type(obj) != dict:
+    if not isinstance(obj, dict):
         return obj
-    else:
-        return {k.replace('-', '_'): normalize_keys(v) for k, v in obj.items()}
+    return {
+        k.translate(_KEBAB_TO_SNAKE): _normalize_keys(v) if isinstance(v, dict) else v
+        for k, v in obj.items()}
 
 
 def config_to_click(config: dict) -> dict:
     """
     Convert a dictionary of configurations loaded from a Flintrock config file
     to a dictionary that Click can use to set default options.
+
+    Config file keys are kebab-case; they get mapped to the snake_case Python
+    parameter names in the same pass that flattens the config sections, so we
+    only walk the config tree once.
     """
     service_configs = {}
 
     if 'services' in config:
-        for service in config['services']:
-            if config['services'][service]:
+        for service, service_config in config['services'].items():
+            if service_config:
                 service_configs.update(
-                    {service + '_' + k: v for (k, v) in config['services'][service].items()})
+                    {service + '_' + k.translate(_KEBAB_TO_SNAKE): _normalize_keys(v)
+                     for (k, v) in service_config.items()})
 
     ec2_configs = {
-        'ec2_' + k: v for (k, v) in config['providers']['ec2'].items()}
+        'ec2_' + k.translate(_KEBAB_TO_SNAKE): _normalize_keys(v)
+        for (k, v) in config['providers']['ec2'].items()}
+
+    launch_configs = {
+        k.translate(_KEBAB_TO_SNAKE): _normalize_keys(v)
+        for (k, v) in config['launch'].items()}
 
     click_map = {
-        'launch': dict(
-            list(config['launch'].items())
-            + list(ec2_configs.items())
-            + list(service_configs.items())),
+        'launch': {**launch_configs, **ec2_configs, **service_configs},
         'describe': ec2_configs,
         'destroy': ec2_configs,
         'login': ec2_configs,
@@ -3,6 +3,7 @@ import os
 import shlex
 import socket
 import sys
+import time
 import urllib.error
 import urllib.request
 import logging
@@ -63,6 +64,29 @@ class SecurityGroupRule:
         return str(vars(self))
 
 
+def wait_for_http_ready(*, url: str, timeout_seconds: int, description: str):
+    """
+    Poll an HTTP endpoint until it responds successfully, raising an exception
+    if it doesn't do so within the given number of seconds.
+    """
+    deadline = time.monotonic() + timeout_seconds
+    # Start with quick checks so a fast-booting service doesn't wait on a
+    # fixed interval, then back off so a slow one isn't hammered with
+    # requests. The interval is capped so we never overshoot a near-ready
+    # service by much.
+    interval = 0.5
+    while True:
+        try:
+            urllib.request.urlopen(url, timeout=2)
+            break
+        except (urllib.error.URLError, socket.timeout):
+            if time.monotonic() >= deadline:
+                raise Exception(
+                    "Timed out waiting for {d} to come up.".format(d=description))
+            time.sleep(max(0.0, min(interval, deadline - time.monotonic())))
+            interval = min(interval * 1.5, 5)
+
+
 class FlintrockService:
     """
     This is an abstract class. Implementations of this class capture all the logic
@@ -457,55 +481,56 @@ class Spark(FlintrockService):
         host = ssh_client.get_transport().getpeername()[0]
         logger.info("[{h}] Configuring Spark master...".format(h=host))
 
-        # This loop is a band-aid for: https://github.com/nchammas/flintrock/issues/129
-        attempt_limit = 3
-        for attempt in range(attempt_limit):
-            try:
-                ssh_check_output(
-                    client=ssh_client,
-                    # Maybe move this shell script out to some separate
-                    # file/folder for the Spark service.
-                    command="""
-                        spark/sbin/start-all.sh
+        ssh_check_output(
+            client=ssh_client,
+            command="""
+                # `|| true` because when slaves are added to a running cluster
+                # the master is already up and spark-daemon.sh exits non-zero.
+                spark/sbin/start-master.sh || true
+            """)
 
-                        master_ui_response_code=0
-                        while [ "$master_ui_response_code" -ne 200 ]; do
-                            sleep 1
-                            master_ui_response_code="$(
-                                curl --head --silent --output /dev/null \
-                                    --write-out "%{{http_code}}" {m}:8080
-                            )"
-                        done
-                    """.format(m=shlex.quote(cluster.master_private_host)),
-                    timeout_seconds=90
-                )
-                break
-            except socket.timeout as e:
-                logger.debug(
-                    "Timed out waiting for Spark master to come up.{}"
-                    .format(" Trying again..." if attempt < attempt_limit - 1 else "")
-                )
-        else:
-            raise Exception("Timed out waiting for Spark master to come up.")
+        # We poll the master UI from here instead of busy-looping curl on the
+        # node, and only start the slaves once the master is accepting
+        # registrations. Unlike the old remote loop, this puts a real bound on
+        # how long we wait for the master to come up.
+        # See: https://github.com/nchammas/flintrock/issues/129
+        wait_for_http_ready(
+            url='http://{m}:8080/'.format(m=cluster.master_ip),
+            timeout_seconds=90,
+            description="Spark master")
+
+        ssh_check_output(
+            client=ssh_client,
+            command="""
+                spark/sbin/start-slaves.sh
+            """)
 
     def health_check(self, master_host: str):
         spark_master_ui = 'http://{m}:8080/json/'.format(m=master_host)
 
         try:
-            json.loads(
+            master_state = json.loads(
                 urllib.request
                 .urlopen(spark_master_ui)
                 .read()
                 .decode('utf-8')
             )
-            # TODO: Don't print here. Return this and let the caller print.
-            logger.info("Spark online.")
         except Exception as e:
             # TODO: Catch a more specific problem known to be related to Spark not
             #       being up; provide a slightly better error message, and don't
             #       dump a large stack trace on the user.
             raise Exception("Spark health check failed.") from e
 
+        # A master that serves its UI but isn't ALIVE (e.g. still in RECOVERY)
+        # won't accept applications, so check the reported status too.
+        if master_state.get('status') != 'ALIVE':
+            raise Exception(
+                "Spark health check failed. Master status is: {s}"
+                .format(s=master_state.get('status')))
+
+        # TODO: Don't print here. Return this and let the caller print.
+        logger.info("Spark online.")
+
     def get_security_group_rules(self, flintrock_client_cidr: str=None, flintrock_client_group: str=None):
         return [
             SecurityGroupRule(
@@ -1,14 +1,14 @@
 import errno
 import os
 import socket
-import subprocess
-import tempfile
 import time
 import logging
 from collections import namedtuple
 
 # External modules
 import paramiko
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 
 # Flintrock modules
 from .util import get_subprocess_env
@@ -24,27 +24,21 @@ def generate_ssh_key_pair() -> SSHKeyPair:
     """
     Generate an SSH key pair that the cluster can use for intra-cluster
     communication.
-    """
-    with tempfile.TemporaryDirectory() as tempdir:
-        subprocess.check_call(
-            [
-                'ssh-keygen',
-                '-q',
-                '-t', 'rsa',
-                '-N', '',
-                '-f', os.path.join(tempdir, 'flintrock_rsa'),
-                '-C', 'flintrock',
-            ],
-            env=get_subprocess_env(),
-        )
-
-        with open(file=os.path.join(tempdir, 'flintrock_rsa')) as private_key_file:
-            private_key = private_key_file.read()
-
-        with open(file=os.path.join(tempdir, 'flintrock_rsa.pub')) as public_key_file:
-            public_key = public_key_file.read()
 
-    return namedtuple('KeyPair', ['public', 'private'])(public_key, private_key)
+    The key is generated in-process so we don't depend on ssh-keygen
+    being available on the client.
+    """
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_key = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    public_key = key.public_key().public_bytes(
+        encoding=serialization.Encoding.OpenSSH,
+        format=serialization.PublicFormat.OpenSSH,
+    ).decode() + ' flintrock'
+    return SSHKeyPair(public=public_key, private=private_key)
 
 
 def get_ssh_client(
@@ -82,21 +76,31 @@ def get_ssh_client(
                 key_filename=identity_file,
                 look_for_keys=False,
                 timeout=3)
+            # Clients are typically held open across several sequential
+            # commands (e.g. install, then configure). Keepalives stop idle
+            # connections from being dropped between those commands.
+            client.get_transport().set_keepalive(30)
             if print_status:
                 logger.info("[{h}] SSH online.".format(h=host))
             break
+        # A failed connect() can leave a half-constructed transport (and its
+        # socket) attached to the client, so close it before retrying to
+        # avoid leaking file descriptors over a long wait.
         except socket.timeout as e:
             logger.debug("[{h}] SSH timeout.".format(h=host))
+            client.close()
             time.sleep(5)
         except paramiko.ssh_exception.NoValidConnectionsError as e:
             if any(error.errno != errno.ECONNREFUSED for error in e.errors.values()):
                 raise
             logger.debug("[{h}] SSH exception: {e}".format(h=host, e=e))
+            client.close()
             time.sleep(5)
         # We get this exception during startup with CentOS but not Amazon Linux,
         # for some reason.
         except paramiko.ssh_exception.AuthenticationException as e:
             logger.debug("[{h}] SSH AuthenticationException.".format(h=host))
+            client.close()
             time.sleep(5)
         except paramiko.ssh_exception.SSHException as e:
             raise SSHError(
@@ -128,12 +132,22 @@ def ssh_check_output(
         get_pty=True,
         timeout=timeout_seconds)
 
-    # NOTE: Paramiko doesn't clearly document this, but we must read() before
-    #       calling recv_exit_status().
+    # NOTE: Paramiko doesn't clearly document this, but we must drain the
+    #       output before calling recv_exit_status().
     #       See: https://github.com/paramiko/paramiko/issues/448#issuecomment-159481997
-    stdout_output = stdout.read().decode('utf8').rstrip('\n')
+    # We pull stdout off the channel in chunks as the command runs -- long
+    # installs can produce megabytes of output, and draining continuously
+    # keeps the remote process from ever blocking on a full pipe buffer.
+    channel = stdout.channel
+    stdout_chunks = []
+    while True:
+        chunk = channel.recv(65536)
+        if not chunk:
+            break
+        stdout_chunks.append(chunk)
+    stdout_output = b''.join(stdout_chunks).decode('utf8').rstrip('\n')
     stderr_output = stderr.read().decode('utf8').rstrip('\n')
-    exit_status = stdout.channel.recv_exit_status()
+    exit_status = channel.recv_exit_status()
 
     if exit_status:
         # TODO: Return a custom exception that includes the return code.
@@ -150,13 +164,18 @@ def ssh_check_output(
 def ssh(*, user: str, host: str, identity_file: str):
     """
     SSH into a host for interactive use.
+
+    This replaces the current process with ssh rather than running it as a
+    child, so the Python interpreter isn't kept around idle for the length
+    of the interactive session. This function does not return.
     """
-    subprocess.call(
+    os.execvpe(
+        'ssh',
         [
             'ssh',
             '-o', 'StrictHostKeyChecking=no',
             '-i', identity_file,
             '{u}@{h}'.format(u=user, h=host),
         ],
-        env=get_subprocess_env(),
+        get_subprocess_env(),
     )